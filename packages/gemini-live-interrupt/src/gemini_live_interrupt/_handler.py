@@ -0,0 +1,259 @@
+"""Per-session interrupt tracking and the default resume prompt.
+
+Kept free of patching logic so it can optionally be compiled with mypyc
+(see the package README); ``_InterruptHandler.process`` runs once per
+streamed server message.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+from google.genai import types
+
+
+# ---------------------------------------------------------------------------
+# Default prompt template
+# ---------------------------------------------------------------------------
+
+def _find_continuation_text(heard: str) -> str:
+    """Given the accumulated output transcription at interruption time,
+    find the start of the last sentence to use as continuation point.
+
+    The sidecar has no audio playback tracking, so ``heard`` is the
+    full accumulated output transcription (approximately what was said).
+    We find the last complete sentence boundary and return from there,
+    so the model restarts at a clean sentence start."""
+    if not heard:
+        return heard
+    heard = heard.strip()
+
+    # Find the last sentence boundary (. ! ? followed by space).
+    last_boundary = 0
+    for i in range(len(heard) - 1):
+        if heard[i] in ".!?" and heard[i + 1] == " ":
+            last_boundary = i + 2
+
+    # If the truncation is mid-sentence, return from sentence start.
+    # If it ends on a boundary, return the full text (model finished
+    # a sentence, so the continuation is whatever comes next).
+    if heard[-1] in ".!?":
+        return heard
+    return heard[last_boundary:].strip()
+
+
+_PROMPT_HEADER = (
+    "[System Note — Interruption Context]\n"
+    "Your previous response was interrupted by the user."
+)
+
+_PROMPT_CONTINUATION_DIRECTIVE = (
+    "If you need to continue the interrupted response, you MUST "
+    "start from the beginning of the sentence that was cut off. "
+    "Say exactly this text (then continue naturally if needed):"
+)
+
+_PROMPT_INSTRUCTIONS = (
+    "=== Instructions ===\n"
+    "Based on the above context, decide the best course of action:\n"
+    "1. If the user's interruption is a new question, request, or "
+    "a clear change of topic — answer it first. Then briefly ask "
+    "if they would like you to continue with the interrupted "
+    "response (e.g., 'Would you like me to finish the story?' or "
+    "'Shall I continue where I left off?').\n"
+    "2. If the user's interruption is a brief acknowledgment, "
+    "background noise, or does not introduce a new topic — "
+    "seamlessly continue by saying the exact continuation text "
+    "above. Start from the sentence beginning, not mid-word.\n"
+    "3. If the user's interruption is partially related (a "
+    "follow-up, clarification, or correction) — briefly address "
+    "it and then continue with the exact continuation text above.\n"
+    "Do NOT mention this system note or that you were interrupted."
+)
+
+_SPEAKER = {"user": "User", "model": "You (Model)"}
+
+
+def _default_prompt(
+    heard: str, user_text: str, history: Sequence[tuple[str, str]]
+) -> str:
+    continuation = _find_continuation_text(heard)
+
+    history_block = ""
+    if history:
+        turns = "\n".join(f"{_SPEAKER[role]}: {text}" for role, text in history)
+        history_block = f"\n\n=== Recent Conversation ===\n{turns}"
+
+    heard_block = ""
+    if heard:
+        heard_block = (
+            f"\n\n=== Interrupted Response ===\nWhat you were saying: {heard}"
+        )
+        if continuation != heard:
+            heard_block += (
+                f"\nThe sentence that was cut off (from its start): {continuation}"
+            )
+
+    user_block = ""
+    if user_text:
+        user_block = (
+            f"\n\n=== What the User Said (interruption) ===\n{user_text}"
+        )
+
+    continuation_block = ""
+    if continuation:
+        continuation_block = (
+            "\n\n=== Exact Continuation Text ===\n"
+            f'{_PROMPT_CONTINUATION_DIRECTIVE}\n"{continuation}"'
+        )
+
+    return (
+        f"{_PROMPT_HEADER}{history_block}{heard_block}{user_block}"
+        f"{continuation_block}\n\n{_PROMPT_INSTRUCTIONS}"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Per-session state tracker
+# ---------------------------------------------------------------------------
+
+class _InterruptHandler:
+    """Tracks transcription and conversation state for a single live session."""
+
+    __slots__ = (
+        "_heard",
+        "_tail_start",
+        "last_text",
+        "history",
+        "last_input",
+        "_last_input_text",
+        "_turn_interrupted",
+        "_prompt_builder",
+    )
+
+    def __init__(
+        self,
+        prompt_builder: Optional[Callable[..., str]] = None,
+        max_history: int = 4,
+    ) -> None:
+        self._prompt_builder = prompt_builder
+
+        # Output transcription accumulated during the current model turn.
+        self._heard: str = ""
+        # Offset in _heard where the most recently appended chunk starts.
+        self._tail_start: int = 0
+        # Dedup tracker for output transcription.
+        self.last_text: str = ""
+        # Rolling (role, text) conversation history; the deque drops the
+        # oldest turn once max_history is reached.
+        self.history: deque[tuple[str, str]] = deque(maxlen=max_history)
+        # Latest user input transcription text.
+        self.last_input: str = ""
+        # Dedup tracker for input transcription.
+        self._last_input_text: str = ""
+        # Whether the current model turn was interrupted (persists until
+        # turn_complete resets it, preventing double history recording).
+        self._turn_interrupted: bool = False
+
+    # -- helpers --
+
+    def _record_turn(self, role: str, text: str) -> None:
+        if not text:
+            return
+        self.history.append((role, text))
+
+    def _append_heard(self, text: str) -> None:
+        # Live output transcriptions arrive as deltas, so chunks are simply
+        # appended; repeated words at a chunk boundary ("that" + "that is")
+        # are real speech.  The one case folded is a cumulative partial that
+        # re-sends the previous chunk and extends it by whole words ("one two"
+        # then "one two three"), which replaces that chunk instead of
+        # repeating it.  The extension must start at a word boundary, so
+        # "the" + "theory" or "a" + "apple" keep both chunks.
+        heard = self._heard
+        if not heard:
+            self._heard = text
+            return
+        tail_start = self._tail_start
+        tail = heard[tail_start:]
+        if len(text) > len(tail) and text.startswith(tail) and text[len(tail)] == " ":
+            self._heard = heard[:tail_start] + text
+        else:
+            self._tail_start = len(heard) + 1
+            self._heard = f"{heard} {text}"
+
+    def _build_prompt(self, heard: str, user_text: str) -> str:
+        if self._prompt_builder is not None:
+            return self._prompt_builder(heard, user_text, list(self.history))
+        return _default_prompt(heard, user_text, self.history)
+
+    # -- main entry point called per server_content message --
+
+    def process(
+        self, session: Any, content: types.LiveServerContent
+    ) -> Optional[Awaitable[Any]]:
+        """Update state from one server_content message.
+
+        Returns the pending ``send_client_content`` call when an
+        interruption needs resume context injected, otherwise ``None``;
+        the caller awaits it."""
+        pending: Optional[Awaitable[Any]] = None
+
+        # --- Track input transcription ---
+        if (
+            content.input_transcription
+            and content.input_transcription.text is not None
+        ):
+            text = content.input_transcription.text.strip()
+            if text and text != self._last_input_text:
+                self.last_input = text
+                self._last_input_text = text
+            if content.input_transcription.finished:
+                if text:
+                    self._record_turn("user", text)
+                self._last_input_text = ""
+
+        # --- Track output transcription ---
+        if (
+            content.output_transcription
+            and content.output_transcription.text is not None
+        ):
+            text = content.output_transcription.text.strip()
+            if text and text != self.last_text:
+                self._append_heard(text)
+                self.last_text = text
+                if content.output_transcription.finished:
+                    self.last_text = ""
+
+        # --- Interruption: inject resume context ---
+        if content.interrupted:
+            heard = self._heard
+            user_text = self.last_input
+
+            if heard or user_text:
+                prompt = self._build_prompt(heard, user_text)
+                pending = session.send_client_content(
+                    turns=types.Content(
+                        role="user",
+                        parts=[types.Part(text=prompt)],
+                    ),
+                    turn_complete=True,
+                )
+
+            self._record_turn("model", heard)
+            self._heard = ""
+            self._tail_start = 0
+            self.last_text = ""
+            self._turn_interrupted = True
+
+        # --- Turn complete: record history, reset state ---
+        if content.turn_complete:
+            if not self._turn_interrupted:
+                self._record_turn("model", self._heard)
+            self._heard = ""
+            self._tail_start = 0
+            self.last_text = ""
+            self._turn_interrupted = False
+
+        return pending
@@ -89,21 +89,25 @@ async def send_pcm(
     detects end-of-speech."""
     chunk_bytes = rate * 2 // 10  # 100 ms of int16 mono
     mime = f"audio/pcm;rate={rate}"
+    loop = asyncio.get_running_loop()
+    # Pace against a fixed schedule so time spent in send_realtime_input()
+    # does not accumulate into drift.
+    next_deadline = loop.time()
 
     for i in range(0, len(pcm), chunk_bytes):
         await session.send_realtime_input(
             audio=types.Blob(data=pcm[i : i + chunk_bytes], mime_type=mime),
         )
-        await asyncio.sleep(0.10)
+        next_deadline += 0.10
+        await asyncio.sleep(max(0.0, next_deadline - loop.time()))
 
     # Trailing silence — lets VAD fire end-of-speech.
-    silence_chunk = b"\x00" * chunk_bytes
+    silence_blob = types.Blob(data=bytes(chunk_bytes), mime_type=mime)
     n_silence = max(1, int(trail_silence_s / 0.10))
     for _ in range(n_silence):
-        await session.send_realtime_input(
-            audio=types.Blob(data=silence_chunk, mime_type=mime),
-        )
-        await asyncio.sleep(0.10)
+        await session.send_realtime_input(audio=silence_blob)
+        next_deadline += 0.10
+        await asyncio.sleep(max(0.0, next_deadline - loop.time()))
 
 
 async def receive_turn(
@@ -114,12 +118,20 @@ async def receive_turn(
 ) -> list[str]:
     """Receive one full model turn.  Returns the list of transcription texts."""
     texts: list[str] = []
-    deadline = asyncio.get_event_loop().time() + timeout
-
-    async for msg in session.receive():
-        if asyncio.get_event_loop().time() > deadline:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    messages = session.receive().__aiter__()
+
+    while True:
+        try:
+            msg = await asyncio.wait_for(
+                messages.__anext__(), timeout=deadline - loop.time()
+            )
+        except asyncio.TimeoutError:
             log(f"{_Y}  [timeout]{_0}")
             break
+        except StopAsyncIteration:
+            break
         if not msg.server_content:
             continue
         sc = msg.server_content
@@ -192,12 +204,20 @@ async def run_test() -> bool:
         pre_transcripts: list[str] = []
         interrupted = False
         interrupt_sent = False
-        deadline = asyncio.get_event_loop().time() + PHASE_TIMEOUT
-
-        async for msg in session.receive():
-            if asyncio.get_event_loop().time() > deadline:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + PHASE_TIMEOUT
+        messages = session.receive().__aiter__()
+
+        while True:
+            try:
+                msg = await asyncio.wait_for(
+                    messages.__anext__(), timeout=deadline - loop.time()
+                )
+            except asyncio.TimeoutError:
                 log(f"{_Y}  [timeout waiting for counting]{_0}")
                 break
+            except StopAsyncIteration:
+                break
             if not msg.server_content:
                 continue
             sc = msg.server_content
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 from dataclasses import dataclass
@@ -14,13 +15,28 @@ DEFAULT_TRANSCRIPTION_MODEL = "whisper-large-v3"
 DEFAULT_LOCATION = "us-central1"
 DEFAULT_INPUT_SAMPLE_RATE_HZ = 16000
 DEFAULT_OUTPUT_SAMPLE_RATE_HZ = 24000
+DEFAULT_INPUT_SEND_MAX_BYTES = 32768
 DEFAULT_VOICE_NAME = "Aoede"
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() in _TRUTHY
+
 
 def _project_id_from_adc_key() -> str | None:
     credentials_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
     if not credentials_path:
         return None
+    return _project_id_from_credentials_file(credentials_path)
+
+
+@functools.lru_cache(maxsize=1)
+def _project_id_from_credentials_file(credentials_path: str) -> str | None:
     path = Path(credentials_path)
     if not path.exists():
         return None
@@ -58,6 +74,9 @@ class LiveTranscriptSettings:
     voice_name: str = DEFAULT_VOICE_NAME
     input_sample_rate_hz: int = DEFAULT_INPUT_SAMPLE_RATE_HZ
     output_sample_rate_hz: int = DEFAULT_OUTPUT_SAMPLE_RATE_HZ
+    # Queued mic frames are coalesced into one send up to this many bytes;
+    # 0 sends every frame on its own.
+    input_send_max_bytes: int = DEFAULT_INPUT_SEND_MAX_BYTES
     enable_proactive_audio: bool = True
     enable_affective_dialog: bool = True
     debug_events: bool = False
@@ -86,20 +105,18 @@ class LiveTranscriptSettings:
                     str(DEFAULT_OUTPUT_SAMPLE_RATE_HZ),
                 )
             ),
-            enable_proactive_audio=os.environ.get(
-                "GEMINI_LIVE_PROACTIVE_AUDIO", "true"
-            ).lower()
-            in {"1", "true", "yes", "on"},
-            enable_affective_dialog=os.environ.get(
-                "GEMINI_LIVE_AFFECTIVE_DIALOG", "true"
-            ).lower()
-            in {"1", "true", "yes", "on"},
-            debug_events=os.environ.get("GEMINI_LIVE_DEBUG_EVENTS", "false").lower()
-            in {"1", "true", "yes", "on"},
-            fallback_to_default_transcription=os.environ.get(
-                "GEMINI_LIVE_FALLBACK_TO_DEFAULT_TRANSCRIPTION", "true"
-            ).lower()
-            in {"1", "true", "yes", "on"},
+            input_send_max_bytes=int(
+                os.environ.get(
+                    "GEMINI_LIVE_INPUT_SEND_MAX_BYTES",
+                    str(DEFAULT_INPUT_SEND_MAX_BYTES),
+                )
+            ),
+            enable_proactive_audio=_env_flag("GEMINI_LIVE_PROACTIVE_AUDIO", True),
+            enable_affective_dialog=_env_flag("GEMINI_LIVE_AFFECTIVE_DIALOG", True),
+            debug_events=_env_flag("GEMINI_LIVE_DEBUG_EVENTS", False),
+            fallback_to_default_transcription=_env_flag(
+                "GEMINI_LIVE_FALLBACK_TO_DEFAULT_TRANSCRIPTION", True
+            ),
             system_instruction=os.environ.get("GEMINI_LIVE_SYSTEM_INSTRUCTION"),
         )
 
@@ -9,20 +9,45 @@ from google.genai import types
 
 _PATCH_LOCK = threading.Lock()
 _PATCH_APPLIED = False
-_PENDING_TRANSCRIPTION_CONFIGS: dict[int, dict[str, dict[str, Any]]] = {}
+# Private attribute stashed on a LiveConnectConfig instance to carry the
+# stripped transcription fields through to serialization.
+_PENDING_ATTR = "_glt_pending_transcription"
+
+
+def _set_pending(
+    config_model: types.LiveConnectConfig,
+    pending: dict[str, dict[str, Any]],
+) -> None:
+    # Bypass pydantic's __setattr__; the value lives in the instance __dict__
+    # and is ignored by validation and model_dump().
+    object.__setattr__(config_model, _PENDING_ATTR, pending)
+
+
+def _pop_pending(
+    config_model: types.LiveConnectConfig,
+) -> dict[str, dict[str, Any]]:
+    return vars(config_model).pop(_PENDING_ATTR, None) or {}
+
+
+_TRANSCRIPTION_KEYS = ("input_audio_transcription", "output_audio_transcription")
 
 
 def _sanitize_transcription_config(
     config: dict[str, Any],
 ) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
-    sanitized = dict(config)
+    # Returns *config* itself when there is nothing to strip; it is only
+    # copied once a transcription field actually has to change.
     pending: dict[str, dict[str, Any]] = {}
-    for key in ("input_audio_transcription", "output_audio_transcription"):
-        value = sanitized.get(key)
+    for key in _TRANSCRIPTION_KEYS:
+        value = config.get(key)
         if isinstance(value, dict) and value:
             pending[key] = dict(value)
-            # Current SDK validates against an empty AudioTranscriptionConfig model.
-            sanitized[key] = {}
+    if not pending:
+        return config, pending
+    sanitized = dict(config)
+    for key in pending:
+        # Current SDK validates against an empty AudioTranscriptionConfig model.
+        sanitized[key] = {}
     return sanitized, pending
 
 
@@ -39,11 +64,12 @@ def _patched_async_live_connect(
         sanitized_config, pending = _sanitize_transcription_config(config)
         config_model = types.LiveConnectConfig(**sanitized_config)
         if pending:
-            _PENDING_TRANSCRIPTION_CONFIGS[id(config_model)] = pending
+            _set_pending(config_model, pending)
         if using_args:
             args = (args[0], config_model, *args[2:])
         else:
-            kwargs = dict(kwargs)
+            # wrapt hands each call a fresh kwargs dict, so it can be updated
+            # in place.
             kwargs["config"] = config_model
 
     return wrapped(*args, **kwargs)
@@ -61,21 +87,20 @@ async def _patched_t_live_connect_config(
     pending: dict[str, dict[str, Any]] = {}
     pending_from_model: dict[str, dict[str, Any]] = {}
     if isinstance(config, types.LiveConnectConfig):
-        pending_from_model = _PENDING_TRANSCRIPTION_CONFIGS.pop(id(config), {})
+        # Pop before calling through: the SDK model_copy()s the config, which
+        # would otherwise carry the attribute over to the copy as well.
+        pending_from_model = _pop_pending(config)
     if isinstance(config, dict):
         sanitized_config, pending = _sanitize_transcription_config(config)
-        if using_args:
-            args = (args[0], sanitized_config, *args[2:])
-        else:
-            kwargs = dict(kwargs)
-            kwargs["config"] = sanitized_config
+        if sanitized_config is not config:
+            if using_args:
+                args = (args[0], sanitized_config, *args[2:])
+            else:
+                kwargs["config"] = sanitized_config
 
     parameter_model: types.LiveConnectConfig = await wrapped(*args, **kwargs)
-    merged_pending = {}
-    merged_pending.update(pending_from_model)
-    merged_pending.update(pending)
-    if merged_pending:
-        _PENDING_TRANSCRIPTION_CONFIGS[id(parameter_model)] = merged_pending
+    if pending_from_model or pending:
+        _set_pending(parameter_model, {**pending_from_model, **pending})
     return parameter_model
 
 
@@ -86,7 +111,7 @@ def _patched_live_connect_parameters_model_dump(
     config_model = getattr(instance, "config", None)
     if config_model is None:
         return dumped
-    pending = _PENDING_TRANSCRIPTION_CONFIGS.pop(id(config_model), None)
+    pending = getattr(config_model, _PENDING_ATTR, None)
     if not pending:
         return dumped
     config_dump = dumped.setdefault("config", {})
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import contextlib
+import os
 import sys
-import threading
+import time
 from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Optional
 
 import sounddevice as sd
@@ -20,9 +21,63 @@ _YELLOW = "\033[33m"
 _CYAN = "\033[36m"
 _RESET = "\033[0m"
 
+# Model audio can arrive well ahead of real time; start the playback ring
+# at two minutes of backlog (it grows if a response gets further ahead).
+_PLAYBACK_BUFFER_SECONDS = 120
+
+
+# Static parts of the resume-context prompt.  Every block after the head
+# starts with the blank line that separates it from the previous one; the
+# *_LINES tuples are the same text pre-split for logging.
+_RESUME_HEAD = (
+    "[System Note — Interruption Context]\n"
+    "Your previous response was interrupted by the user."
+)
+_RESUME_CONTINUATION_DIRECTIVE = (
+    "\n\n=== Exact Continuation Text ===\n"
+    "If you need to continue the interrupted response, you MUST "
+    "start from the beginning of the sentence that was cut off. "
+    "Say exactly this text (then continue naturally if needed):"
+)
+_RESUME_INSTRUCTIONS = (
+    "\n\n=== Instructions ===\n"
+    "Based on the above context, decide the best course of action:\n"
+    "1. If the user's interruption is a new question, request, or "
+    "a clear change of topic — answer it first. Then briefly ask "
+    "if they would like you to continue with the interrupted "
+    "response (e.g., 'Would you like me to finish the story?' or "
+    "'Shall I continue where I left off?').\n"
+    "2. If the user's interruption is a brief acknowledgment, "
+    "background noise, or does not introduce a new topic — "
+    "seamlessly continue by saying the exact continuation text "
+    "above. Start from the sentence beginning, not mid-word.\n"
+    "3. If the user's interruption is partially related (a "
+    "follow-up, clarification, or correction) — briefly address "
+    "it and then continue with the exact continuation text above.\n"
+    "Do NOT mention this system note or that you were interrupted."
+)
+_RESUME_HEAD_LINES = tuple(_RESUME_HEAD.split("\n"))
+_RESUME_INSTRUCTIONS_LINES = tuple(_RESUME_INSTRUCTIONS.split("\n")[1:])
+
+
+# Log lines are written to stdout unflushed and flushed at most this often,
+# rather than once per line.
+_STDOUT_FLUSH_INTERVAL_S = 0.05
+
+
+# (epoch second, "HH:MM:SS." prefix) of the last log line; the prefix is
+# only re-formatted when the second changes.
+_TS_CACHE: tuple[int, str] = (-1, "")
+
 
 def _ts() -> str:
-    return datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    global _TS_CACHE
+    second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _TS_CACHE
+    if second != cached_second:
+        prefix = time.strftime("%H:%M:%S.", time.localtime(second))
+        _TS_CACHE = (second, prefix)
+    return f"{prefix}{micros // 1000:03d}"
 
 
 @dataclass(slots=True)
@@ -35,16 +90,21 @@ class TranscriptState:
     last_enqueued_output_text: str = ""
     pending_output_segments: deque[tuple[str, bool, int]] = field(default_factory=deque)
     printed_output_segments: list[tuple[str, bool, int]] = field(default_factory=list)
+    # Texts of printed_output_segments, space-joined as they are printed.
+    printed_output_joined: str = ""
     model_turn_complete: bool = False
     interruption_count: int = 0
     events: list[str] = field(default_factory=list)
     # All output transcription text received during the current model turn,
     # accumulated regardless of interruption state.  This is the model's native
     # transcription (ground truth) and may extend beyond what was played.
-    turn_all_output_texts: list[str] = field(default_factory=list)
+    # Kept pre-joined with single spaces so snapshots need no re-join.
+    turn_all_output_texts_joined: str = ""
     last_full_output_text: str = ""
     # Rolling conversation history (kept to last 4 turns = 2 exchanges).
-    conversation_history: list[tuple[str, str]] = field(default_factory=list)
+    conversation_history: deque[tuple[str, str]] = field(
+        default_factory=lambda: deque(maxlen=4)
+    )
     # Interruption resume data — heard is set on interrupt, full on turn_complete.
     interrupted_full_transcript: str = ""
     interrupted_heard_transcript: str = ""
@@ -52,46 +112,117 @@ class TranscriptState:
     needs_resume: bool = False
 
 
+def _copy_into_ring(view: memoryview, capacity: int, pos: int, src: memoryview) -> None:
+    size = len(src)
+    offset = pos % capacity
+    first = min(size, capacity - offset)
+    view[offset : offset + first] = src[:first]
+    if first < size:
+        view[: size - first] = src[first:]
+
+
+def _copy_from_ring(view: memoryview, capacity: int, pos: int, dst: memoryview) -> None:
+    size = len(dst)
+    offset = pos % capacity
+    first = min(size, capacity - offset)
+    dst[:first] = view[offset : offset + first]
+    if first < size:
+        dst[first:] = view[: size - first]
+
+
 class PlaybackBuffer:
-    def __init__(self) -> None:
-        self._buf = bytearray()
-        self._lock = threading.Lock()
-        self._total_received = 0
-        self._total_played = 0
-
-    def append(self, chunk: bytes) -> None:
-        with self._lock:
-            self._buf.extend(chunk)
-            self._total_received += len(chunk)
-
-    def read(self, n_bytes: int) -> bytes:
-        with self._lock:
-            if not self._buf:
-                return b""
-            size = min(n_bytes, len(self._buf))
-            out = bytes(self._buf[:size])
-            del self._buf[:size]
-            self._total_played += size
-            return out
+    """Growable single-producer/single-consumer ring of model audio.
+
+    The receive task is the only producer (``append``/``clear``) and the
+    sounddevice output callback the only consumer (``read_into``).  Positions
+    are monotonic byte counters, each owned by one side and published only
+    after the bytes it covers are in place, so neither side takes a lock.  The
+    counter properties are plain int loads and safe to read from any thread.
+
+    The backing store is published as one ``(view, capacity)`` tuple.  When
+    an append does not fit, the producer copies the unplayed bytes into a
+    larger ring and swaps the tuple; the old ring is never written again, so
+    a read already in flight on it still sees valid data.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._ring: tuple[memoryview, int] = (memoryview(bytearray(capacity)), capacity)
+        # Producer-owned.
+        self._write_pos = 0
+        self._discard_pos = 0
+        # Consumer-owned.
+        self._read_pos = 0
+
+    def append(self, chunk: bytes) -> bool:
+        """Copy *chunk* into the ring.  Returns True if the ring had to grow
+        to make room for it."""
+        size = len(chunk)
+        if not size:
+            return False
+        view, capacity = self._ring
+        # Only the consumer's own position frees space: bytes skipped by
+        # clear() may still be mid-copy inside read_into(), so they count as
+        # used until its next call (at most one output block later).  An
+        # append in that window grows the ring rather than overwrite them.
+        grew = self._write_pos - self._read_pos + size > capacity
+        if grew:
+            view, capacity = self._grow(size)
+        _copy_into_ring(view, capacity, self._write_pos, memoryview(chunk))
+        self._write_pos += size
+        return grew
+
+    def _grow(self, size: int) -> tuple[memoryview, int]:
+        # Copy from the consumer's position, not the discard point: a read
+        # that started before a clear() may still resume from there.
+        start = self._read_pos
+        pending = self._write_pos - start
+        old_view, old_capacity = self._ring
+        capacity = old_capacity
+        while pending + size > capacity:
+            capacity *= 2
+        unplayed = memoryview(bytearray(pending))
+        _copy_from_ring(old_view, old_capacity, start, unplayed)
+        ring = (memoryview(bytearray(capacity)), capacity)
+        _copy_into_ring(ring[0], capacity, start, unplayed)
+        self._ring = ring
+        return ring
+
+    def read_into(self, dst: memoryview) -> int:
+        """Copy up to ``len(dst)`` bytes straight into *dst*.  Returns the
+        number of bytes written."""
+        start = max(self._read_pos, self._discard_pos)
+        size = min(len(dst), self._write_pos - start)
+        if size <= 0:
+            # Still step over anything clear() discarded, so append() sees
+            # that space as free.
+            self._read_pos = start
+            return 0
+        # Load the ring after the positions: any ring published before
+        # _write_pos was read holds every byte up to it.
+        view, capacity = self._ring
+        _copy_from_ring(view, capacity, start, dst[:size])
+        self._read_pos = start + size
+        return size
 
     def clear(self) -> None:
-        with self._lock:
-            self._total_played += len(self._buf)
-            self._buf.clear()
+        # Skip everything written so far; read_into() honours it on its next
+        # call.
+        self._discard_pos = self._write_pos
 
     @property
     def total_received(self) -> int:
-        with self._lock:
-            return self._total_received
+        return self._write_pos
 
     @property
     def total_played(self) -> int:
-        with self._lock:
-            return self._total_played
+        return max(self._read_pos, self._discard_pos)
+
+    def buffered_bytes(self) -> int:
+        return self._write_pos - max(self._read_pos, self._discard_pos)
 
-    def stats(self) -> tuple[int, int, int]:
-        with self._lock:
-            return self._total_received, self._total_played, len(self._buf)
+    @property
+    def capacity_bytes(self) -> int:
+        return self._ring[1]
 
 
 class LiveTranscriptionRunner:
@@ -99,110 +230,198 @@ class LiveTranscriptionRunner:
         self.settings = settings
         self.state = TranscriptState()
         self._stop_event = asyncio.Event()
-        self._input_audio_q: asyncio.Queue[bytes] = asyncio.Queue(maxsize=128)
-        self._playback = PlaybackBuffer()
+        # Mic chunks appended directly from the PortAudio thread (deque
+        # append/popleft are atomic); maxlen drops the oldest on overflow.
+        self._input_chunks: deque[bytearray] = deque(maxlen=128)
+        self._input_ready = asyncio.Event()
+        # Recycled mic frame buffers so the audio thread does not allocate.
+        self._input_pool: deque[bytearray] = deque()
+        self._audio_mime = f"audio/pcm;rate={settings.input_sample_rate_hz}"
+        self._playback = PlaybackBuffer(
+            settings.output_sample_rate_hz * 2 * _PLAYBACK_BUFFER_SECONDS
+        )
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # One second of int16 silence, sliced to pad short playback reads.
+        self._silence = memoryview(bytes(settings.output_sample_rate_hz * 2))
+        # Wakes _playback_sync_loop when a segment is queued or playback
+        # reaches _flush_watermark (a total_played byte position).  The loop
+        # is the only writer of _flush_watermark; the output callback only
+        # records the mark it last signalled, so a newly armed mark is never
+        # cleared by a callback that read the previous one.
+        self._flush_event = asyncio.Event()
+        self._flush_watermark: Optional[int] = None
+        self._signalled_watermark: Optional[int] = None
+        # Playback thresholds, in bytes of int16 mono output audio.
+        bytes_per_second = settings.output_sample_rate_hz * 2
+        # Allow text to lead audio by ~100ms.
+        self._lead_bytes = int(bytes_per_second * 0.1)
+        # A turn counts as played out once <= 20ms of audio remains.
+        self._playback_threshold_bytes = int(bytes_per_second * 0.020)
+        self._stdout_flush_handle: Optional[asyncio.TimerHandle] = None
 
     def _log(self, text: str) -> None:
         line = f"[{_ts()}] {text}"
         self.state.events.append(line)
-        print(line, flush=True)
+        sys.stdout.write(f"{line}\n")
+        if self._loop is None:
+            sys.stdout.flush()
+        elif self._stdout_flush_handle is None:
+            self._stdout_flush_handle = self._loop.call_later(
+                _STDOUT_FLUSH_INTERVAL_S, self._flush_stdout
+            )
+
+    def _flush_stdout(self) -> None:
+        if self._stdout_flush_handle is not None:
+            self._stdout_flush_handle.cancel()
+            self._stdout_flush_handle = None
+        with contextlib.suppress(ValueError):
+            sys.stdout.flush()
 
     def _log_event(self, text: str) -> None:
         if self.settings.debug_events:
             self._log(f"[EVENT] {text}")
 
+    def _log_event_threadsafe(self, text: str) -> None:
+        """_log_event for the PortAudio threads: the line is formatted and
+        written on the event loop, never on the audio thread."""
+        if self.settings.debug_events and self._loop is not None:
+            with contextlib.suppress(RuntimeError):
+                self._loop.call_soon_threadsafe(self._log_event, text)
+
     def _log_transcript(self, speaker: str, text: str, is_final: bool) -> None:
         stage = "FINAL" if is_final else "PARTIAL"
         self._log(f"[{speaker}][{stage}] {text}")
 
-    def _enqueue_input_chunk(self, chunk: bytes) -> None:
-        if self._stop_event.is_set():
-            return
-        try:
-            self._input_audio_q.put_nowait(chunk)
-            return
-        except asyncio.QueueFull:
-            pass
-        try:
-            self._input_audio_q.get_nowait()
-        except asyncio.QueueEmpty:
-            pass
+    def _acquire_input_buf(self, n_bytes: int) -> bytearray:
         try:
-            self._input_audio_q.put_nowait(chunk)
-        except asyncio.QueueFull:
-            pass
+            buf = self._input_pool.pop()
+        except IndexError:
+            return bytearray(n_bytes)
+        if len(buf) != n_bytes:
+            return bytearray(n_bytes)
+        return buf
+
+    def _release_input_buf(self, buf: bytearray) -> None:
+        self._input_pool.append(buf)
 
     def _input_callback(self, indata: bytes, frames: int, time: object, status: sd.CallbackFlags) -> None:
         if status:
-            self._log_event(f"audio-input-status {status}")
-        if self._loop is None:
+            self._log_event_threadsafe(f"audio-input-status {status}")
+        if self._loop is None or self._stop_event.is_set():
             return
-        self._loop.call_soon_threadsafe(self._enqueue_input_chunk, bytes(indata))
+        buf = self._acquire_input_buf(len(indata))
+        buf[:] = indata
+        self._input_chunks.append(buf)
+        # The send loop drains everything once woken, so only the
+        # empty -> non-empty transition needs a cross-thread wakeup.
+        if len(self._input_chunks) == 1:
+            self._loop.call_soon_threadsafe(self._input_ready.set)
 
     def _output_callback(
         self, outdata: bytearray, frames: int, time: object, status: sd.CallbackFlags
     ) -> None:
         if status:
-            self._log_event(f"audio-output-status {status}")
+            self._log_event_threadsafe(f"audio-output-status {status}")
         needed = frames * 2
-        chunk = self._playback.read(needed)
-        if len(chunk) < needed:
-            chunk += b"\x00" * (needed - len(chunk))
-        outdata[:] = chunk
+        out = memoryview(outdata)
+        got = self._playback.read_into(out[:needed])
+        if got < needed:
+            out[got:needed] = self._silence[: needed - got]
+        mark = self._flush_watermark
+        if (
+            mark is not None
+            and mark != self._signalled_watermark
+            and self._loop is not None
+            and self._playback.total_played >= mark
+        ):
+            self._signalled_watermark = mark
+            self._loop.call_soon_threadsafe(self._flush_event.set)
 
     async def _send_audio_loop(self, session: object) -> None:
-        mime_type = f"audio/pcm;rate={self.settings.input_sample_rate_hz}"
+        chunks = self._input_chunks
+        max_bytes = self.settings.input_send_max_bytes
         while not self._stop_event.is_set():
-            chunk = await self._input_audio_q.get()
-            await session.send_realtime_input(
-                audio=types.Blob(data=chunk, mime_type=mime_type)
-            )
-
-    def _playback_backlog_ms(self) -> float:
-        _, _, buffered_bytes = self._playback.stats()
-        return (buffered_bytes / 2.0) * 1000.0 / float(self.settings.output_sample_rate_hz)
+            await self._input_ready.wait()
+            self._input_ready.clear()
+            while chunks:
+                # Coalesce whatever queued up during the last send.
+                batch = [chunks.popleft()]
+                size = len(batch[0])
+                while chunks and size < max_bytes:
+                    buf = chunks.popleft()
+                    batch.append(buf)
+                    size += len(buf)
+                # The SDK serialises Blob.data as bytes, so the copy out of
+                # the pooled buffers happens here, off the audio thread.
+                chunk = bytes(batch[0]) if len(batch) == 1 else b"".join(batch)
+                for buf in batch:
+                    self._release_input_buf(buf)
+                # Both fields are known-good, so skip pydantic validation.
+                await session.send_realtime_input(
+                    audio=types.Blob.model_construct(data=chunk, mime_type=self._audio_mime)
+                )
 
     def _flush_pending_transcripts(self, *, force: bool = False) -> None:
         """Print pending output transcript segments that have synced with audio playback."""
         if self.state.model_turn_interrupted:
             return
         played = self._playback.total_played
-        # Allow text to lead audio by ~100ms worth of bytes.
-        lead_bytes = int(self.settings.output_sample_rate_hz * 2 * 0.1)
+        lead_bytes = self._lead_bytes
         while self.state.pending_output_segments:
             text, is_final, audio_at = self.state.pending_output_segments[0]
             if not force and played + lead_bytes < audio_at:
                 break
             self.state.pending_output_segments.popleft()
             if text and text != self.state.last_output_text:
-                self._log_transcript("MODEL", text, is_final)
-                self.state.printed_output_segments.append((text, is_final, audio_at))
-                self.state.last_output_text = text
+                self._print_output_segment(text, is_final, audio_at)
             if is_final:
                 self.state.last_output_text = ""
 
+    def _print_output_segment(self, text: str, is_final: bool, audio_at: int) -> None:
+        self._log_transcript("MODEL", text, is_final)
+        self.state.printed_output_segments.append((text, is_final, audio_at))
+        joined = self.state.printed_output_joined
+        self.state.printed_output_joined = f"{joined} {text}" if joined else text
+        self.state.last_output_text = text
+
+    def _arm_flush_watermark(self) -> None:
+        """Set the playback position at which the output callback should
+        wake the sync loop: the next pending segment coming due, or the
+        backlog draining after turn_complete."""
+        marks: list[int] = []
+        if self.state.pending_output_segments and not self.state.model_turn_interrupted:
+            marks.append(self.state.pending_output_segments[0][2] - self._lead_bytes)
+        if self.state.model_turn_complete:
+            marks.append(self._playback.total_received - self._playback_threshold_bytes)
+        self._flush_watermark = min(marks) if marks else None
+
     async def _playback_sync_loop(self) -> None:
         while not self._stop_event.is_set():
             self._flush_pending_transcripts()
-            if self.state.model_turn_complete and self._playback_backlog_ms() <= 20.0:
+            if (
+                self.state.model_turn_complete
+                and self._playback.buffered_bytes() <= self._playback_threshold_bytes
+            ):
                 self._flush_pending_transcripts(force=True)
                 self.state.model_speaking = False
                 self.state.model_turn_complete = False
                 self.state.model_turn_audio_started = False
                 self.state.printed_output_segments.clear()
+                self.state.printed_output_joined = ""
                 self.state.last_enqueued_output_text = ""
-                self.state.turn_all_output_texts.clear()
+                self.state.turn_all_output_texts_joined = ""
                 self.state.last_full_output_text = ""
-            await asyncio.sleep(0.03)
+            self._arm_flush_watermark()
+            # Event-driven; the timeout is only a safety net.
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_event.wait(), timeout=0.1)
+            self._flush_event.clear()
 
     def _record_turn(self, role: str, text: str) -> None:
         """Append a turn to conversation history, keeping the last 4 entries."""
         if not text:
             return
         self.state.conversation_history.append((role, text))
-        if len(self.state.conversation_history) > 4:
-            self.state.conversation_history[:] = self.state.conversation_history[-4:]
 
     @staticmethod
     def _find_continuation_text(full: str, heard: str) -> str:
@@ -257,66 +476,40 @@ class LiveTranscriptionRunner:
 
         continuation = self._find_continuation_text(full, heard)
 
-        lines: list[str] = []
-        lines.append(
-            "[System Note — Interruption Context]\n"
-            "Your previous response was interrupted by the user."
-        )
-
         # --- Recent conversation (last 2 exchanges) ---
         history = self.state.conversation_history
+        history_block = ""
         if history:
-            lines.append("")
-            lines.append("=== Recent Conversation ===")
-            for role, text in history:
-                speaker = "User" if role == "user" else "You (Model)"
-                lines.append(f"{speaker}: {text}")
+            history_block = "\n\n=== Recent Conversation ===" + "".join(
+                f"\n{'User' if role == 'user' else 'You (Model)'}: {text}"
+                for role, text in history
+            )
 
         # --- What the user heard and what they missed ---
-        lines.append("")
-        lines.append("=== Interrupted Response ===")
-        lines.append(f"What the user heard: {heard}")
-        lines.append(f"What the user did NOT hear: {continuation}")
+        comparison_block = (
+            "\n\n=== Interrupted Response ===\n"
+            f"What the user heard: {heard}\n"
+            f"What the user did NOT hear: {continuation}"
+        )
 
         # --- User's interrupting speech ---
+        user_block = ""
         if user_text:
-            lines.append("")
-            lines.append("=== What the User Said (interruption) ===")
-            lines.append(user_text)
+            user_block = f"\n\n=== What the User Said (interruption) ===\n{user_text}"
 
         # --- Continuation directive ---
-        lines.append("")
-        lines.append("=== Exact Continuation Text ===")
-        lines.append(
-            "If you need to continue the interrupted response, you MUST "
-            "start from the beginning of the sentence that was cut off. "
-            "Say exactly this text (then continue naturally if needed):"
-        )
-        lines.append(f'"{continuation}"')
-
-        # --- Smart routing instructions ---
-        lines.append("")
-        lines.append(
-            "=== Instructions ===\n"
-            "Based on the above context, decide the best course of action:\n"
-            "1. If the user's interruption is a new question, request, or "
-            "a clear change of topic — answer it first. Then briefly ask "
-            "if they would like you to continue with the interrupted "
-            "response (e.g., 'Would you like me to finish the story?' or "
-            "'Shall I continue where I left off?').\n"
-            "2. If the user's interruption is a brief acknowledgment, "
-            "background noise, or does not introduce a new topic — "
-            "seamlessly continue by saying the exact continuation text "
-            "above. Start from the sentence beginning, not mid-word.\n"
-            "3. If the user's interruption is partially related (a "
-            "follow-up, clarification, or correction) — briefly address "
-            "it and then continue with the exact continuation text above.\n"
-            "Do NOT mention this system note or that you were interrupted."
+        body = (
+            f"{history_block}{comparison_block}{user_block}"
+            f'{_RESUME_CONTINUATION_DIRECTIVE}\n"{continuation}"'
         )
 
-        prompt = "\n".join(lines)
+        prompt = f"{_RESUME_HEAD}{body}{_RESUME_INSTRUCTIONS}"
         self._log(f"{_CYAN}[RESUME CONTEXT]{_RESET} injected ({len(prompt)} chars):")
-        for pline in prompt.splitlines():
+        for pline in (
+            *_RESUME_HEAD_LINES,
+            *body.split("\n")[1:],
+            *_RESUME_INSTRUCTIONS_LINES,
+        ):
             self._log(f"{_CYAN}  | {pline}{_RESET}")
 
         # Inject as a user turn with turn_complete=True so the model
@@ -332,26 +525,37 @@ class LiveTranscriptionRunner:
         )
 
     async def _handle_server_content(self, content: types.LiveServerContent) -> None:
-        if content.input_transcription and content.input_transcription.text is not None:
-            text = content.input_transcription.text.strip()
+        input_tx = content.input_transcription
+        output_tx = content.output_transcription
+        model_turn = content.model_turn
+        interrupted = content.interrupted
+        generation_complete = content.generation_complete
+        turn_complete = content.turn_complete
+        if not (
+            input_tx or output_tx or model_turn or interrupted
+            or generation_complete or turn_complete
+        ):
+            return
+
+        if input_tx and input_tx.text is not None:
+            text = input_tx.text.strip()
             if text and text != self.state.last_input_text:
-                self._log_transcript(
-                    "USER", text, bool(content.input_transcription.finished)
-                )
+                self._log_transcript("USER", text, bool(input_tx.finished))
                 self.state.last_input_text = text
-            if content.input_transcription.finished:
+            if input_tx.finished:
                 if text:
                     self._record_turn("user", text)
                 self.state.last_input_text = ""
 
-        if content.output_transcription and content.output_transcription.text is not None:
-            text = content.output_transcription.text.strip()
-            is_final = bool(content.output_transcription.finished)
+        if output_tx and output_tx.text is not None:
+            text = output_tx.text.strip()
+            is_final = bool(output_tx.finished)
             # Always accumulate native transcription (ground truth) even after
             # interruption — post-interruption segments represent text the model
             # generated but whose audio was cut off.
             if text and text != self.state.last_full_output_text:
-                self.state.turn_all_output_texts.append(text)
+                joined = self.state.turn_all_output_texts_joined
+                self.state.turn_all_output_texts_joined = f"{joined} {text}" if joined else text
                 self.state.last_full_output_text = text
                 if is_final:
                     self.state.last_full_output_text = ""
@@ -360,22 +564,26 @@ class LiveTranscriptionRunner:
                 self.state.pending_output_segments.append(
                     (text, is_final, self._playback.total_received)
                 )
+                self._flush_event.set()
                 self.state.last_enqueued_output_text = text
                 if is_final:
                     self.state.last_enqueued_output_text = ""
             self.state.model_speaking = True
 
-        if content.model_turn and content.model_turn.parts:
-            for part in content.model_turn.parts:
+        if model_turn and model_turn.parts:
+            for part in model_turn.parts:
                 if part.inline_data and part.inline_data.data:
                     if not self.state.model_turn_interrupted:
-                        self._playback.append(part.inline_data.data)
+                        if self._playback.append(part.inline_data.data):
+                            self._log_event(
+                                f"playback buffer grown to {self._playback.capacity_bytes} bytes"
+                            )
                         self.state.model_speaking = True
                         self.state.model_turn_audio_started = True
                 if part.text:
                     self._log_event(f"model-text {part.text}")
 
-        if content.interrupted:
+        if interrupted:
             played = self._playback.total_played
 
             # Flush pending segments up to what was actually played.
@@ -385,32 +593,25 @@ class LiveTranscriptionRunner:
                     break
                 self.state.pending_output_segments.popleft()
                 if text and text != self.state.last_output_text:
-                    self._log_transcript("MODEL", text, is_final)
-                    self.state.printed_output_segments.append((text, is_final, audio_at))
-                    self.state.last_output_text = text
+                    self._print_output_segment(text, is_final, audio_at)
 
-            # Find the last segment the user actually heard.
+            # Find the last segment the user actually heard.  audio_at is
+            # non-decreasing, so walk back from the newest segment.
             last_heard_text = ""
-            for seg_text, _, audio_at in self.state.printed_output_segments:
+            for seg_text, _, audio_at in reversed(self.state.printed_output_segments):
                 if audio_at <= played:
                     last_heard_text = seg_text
-                else:
                     break
 
             # Snapshot BOTH transcripts at interruption time, before state
             # is cleared and before the next turn's transcription can arrive.
             #
             # Full (native): everything the model transcribed for this turn.
-            self.state.interrupted_full_transcript = " ".join(
-                self.state.turn_all_output_texts
-            )
+            self.state.interrupted_full_transcript = self.state.turn_all_output_texts_joined
             # Heard (real-time): all printed segments — the sync loop already
             # gates printing to within ~300ms of playback, so every printed
             # segment was heard (or about to be heard) by the user.
-            heard_texts = [t for t, _, _ in self.state.printed_output_segments]
-            self.state.interrupted_heard_transcript = (
-                " ".join(heard_texts) if heard_texts else last_heard_text
-            )
+            self.state.interrupted_heard_transcript = self.state.printed_output_joined
             self.state.interrupted_input_text = self.state.last_input_text
 
             self._playback.clear()
@@ -419,9 +620,10 @@ class LiveTranscriptionRunner:
             self.state.model_turn_interrupted = True
             self.state.pending_output_segments.clear()
             self.state.printed_output_segments.clear()
+            self.state.printed_output_joined = ""
             self.state.last_enqueued_output_text = ""
             # Clear the accumulator so the next model turn starts fresh.
-            self.state.turn_all_output_texts.clear()
+            self.state.turn_all_output_texts_joined = ""
             self.state.last_full_output_text = ""
 
             # Inject resume context NOW — before the model starts generating
@@ -434,10 +636,10 @@ class LiveTranscriptionRunner:
                 self._log(f"{_YELLOW}[MODEL][INTERRUPTED] {last_heard_text}{_RESET}")
             self._log_event("model output interrupted by user speech")
 
-        if content.generation_complete:
+        if generation_complete:
             self._log_event("generation_complete=True")
 
-        if content.turn_complete:
+        if turn_complete:
             # Record the model turn to conversation history and trigger resume
             # if the turn was interrupted — must happen before resetting the flag.
             if self.state.model_turn_interrupted:
@@ -449,20 +651,22 @@ class LiveTranscriptionRunner:
                     or self.state.interrupted_full_transcript,
                 )
             else:
-                full_text = " ".join(self.state.turn_all_output_texts)
+                full_text = self.state.turn_all_output_texts_joined
                 if full_text.strip():
                     self._record_turn("model", full_text.strip())
 
             self.state.model_turn_complete = True
             self.state.model_turn_interrupted = False
-            reason = (
-                content.turn_complete_reason.value
-                if content.turn_complete_reason is not None
-                else "UNKNOWN"
-            )
-            self._log_event(
-                f"turn_complete=True reason={reason} waiting_for_input={content.waiting_for_input}"
-            )
+            self._flush_event.set()
+            if self.settings.debug_events:
+                reason = (
+                    content.turn_complete_reason.value
+                    if content.turn_complete_reason is not None
+                    else "UNKNOWN"
+                )
+                self._log_event(
+                    f"turn_complete=True reason={reason} waiting_for_input={content.waiting_for_input}"
+                )
 
     async def _receive_loop(self, session: object) -> None:
         while not self._stop_event.is_set():
@@ -474,29 +678,32 @@ class LiveTranscriptionRunner:
                 if self._stop_event.is_set():
                     return
 
-                if message.go_away:
-                    self._log_event(f"go_away time_left={message.go_away.time_left}")
-
-                if message.voice_activity_detection_signal:
-                    vad = message.voice_activity_detection_signal.vad_signal_type.value
-                    self._log_event(f"vad_signal={vad}")
-
-                if message.voice_activity:
-                    activity = message.voice_activity.voice_activity_type.value
-                    self._log_event(f"voice_activity={activity}")
-
-                if message.session_resumption_update:
-                    update = message.session_resumption_update
-                    self._log_event(
-                        "session_resumption_update "
-                        f"resumable={update.resumable} "
-                        f"last_consumed_client_message_index={update.last_consumed_client_message_index}"
-                    )
-
-                if message.tool_call:
-                    self._log_event("tool_call received")
-                if message.tool_call_cancellation:
-                    self._log_event("tool_call_cancellation received")
+                # Event-only fields: skip inspecting and formatting them
+                # unless debug logging is on.
+                if self.settings.debug_events:
+                    if message.go_away:
+                        self._log_event(f"go_away time_left={message.go_away.time_left}")
+
+                    if message.voice_activity_detection_signal:
+                        vad = message.voice_activity_detection_signal.vad_signal_type.value
+                        self._log_event(f"vad_signal={vad}")
+
+                    if message.voice_activity:
+                        activity = message.voice_activity.voice_activity_type.value
+                        self._log_event(f"voice_activity={activity}")
+
+                    if message.session_resumption_update:
+                        update = message.session_resumption_update
+                        self._log_event(
+                            "session_resumption_update "
+                            f"resumable={update.resumable} "
+                            f"last_consumed_client_message_index={update.last_consumed_client_message_index}"
+                        )
+
+                    if message.tool_call:
+                        self._log_event("tool_call received")
+                    if message.tool_call_cancellation:
+                        self._log_event("tool_call_cancellation received")
 
                 if message.server_content:
                     await self._handle_server_content(message.server_content)
@@ -507,12 +714,68 @@ class LiveTranscriptionRunner:
             if not got_any_message:
                 await asyncio.sleep(0.05)
 
+    def _start_stdin_reader(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> Optional[tuple[int, asyncio.Queue[str]]]:
+        """Watch stdin from the event loop and queue each line read from it,
+        with "" marking EOF.  Returns None where the loop cannot watch stdin
+        (Windows, no file descriptor, regular files), so the caller falls
+        back to a blocking readline in a worker thread."""
+        if sys.platform == "win32":
+            return None
+        try:
+            fd = sys.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+        lines: asyncio.Queue[str] = asyncio.Queue()
+        decoder = codecs.getincrementaldecoder(sys.stdin.encoding or "utf-8")("replace")
+        partial = ""
+
+        def on_readable() -> None:
+            nonlocal partial
+            try:
+                data = os.read(fd, 4096)
+            except BlockingIOError:
+                return
+            except OSError:
+                data = b""
+            if not data:
+                loop.remove_reader(fd)
+                partial += decoder.decode(b"", final=True)
+                if partial:
+                    lines.put_nowait(partial)
+                lines.put_nowait("")
+                return
+            *complete, partial = (partial + decoder.decode(data)).split("\n")
+            for line in complete:
+                lines.put_nowait(line + "\n")
+
+        try:
+            loop.add_reader(fd, on_readable)
+        except (NotImplementedError, OSError, ValueError):
+            return None
+        return fd, lines
+
     async def _keyboard_loop(self, session: object) -> None:
         self._log_event(
             "Audio mode enabled. Speak into mic. Commands: /interrupt, /quit, /text <message>."
         )
+        loop = asyncio.get_running_loop()
+        reader = self._start_stdin_reader(loop)
+        try:
+            await self._handle_keyboard_input(session, reader)
+        finally:
+            if reader is not None:
+                loop.remove_reader(reader[0])
+
+    async def _handle_keyboard_input(
+        self, session: object, reader: Optional[tuple[int, asyncio.Queue[str]]]
+    ) -> None:
         while not self._stop_event.is_set():
-            line = await asyncio.to_thread(sys.stdin.readline)
+            if reader is not None:
+                line = await reader[1].get()
+            else:
+                line = await asyncio.to_thread(sys.stdin.readline)
             if not line:
                 self._stop_event.set()
                 return
@@ -539,6 +802,13 @@ class LiveTranscriptionRunner:
 
     async def run(self) -> None:
         self._loop = asyncio.get_running_loop()
+        try:
+            await self._connect_and_run()
+        finally:
+            self._flush_stdout()
+            self._loop = None
+
+    async def _connect_and_run(self) -> None:
         client = create_vertex_client(self.settings)
         config = build_live_connect_config(self.settings)
 
@@ -609,27 +879,19 @@ class LiveTranscriptionRunner:
         stop_task = asyncio.create_task(self._stop_event.wait())
 
         tasks = {send_audio_task, receive_task, playback_sync_task, keyboard_task}
-        while not self._stop_event.is_set():
-            done, _ = await asyncio.wait(
-                tasks | {stop_task},
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-            if stop_task in done:
-                break
-
-            for task in list(done):
-                if task.cancelled():
-                    continue
-                exc = task.exception()
-                if exc is not None:
-                    self._stop_event.set()
-                    break
-                if task in tasks:
-                    # A worker task ending unexpectedly means connection/input
-                    # loop has ended; stop session cleanly.
-                    self._log_event("worker task finished; ending session")
-                    self._stop_event.set()
-                    break
+        # Every way out — /quit, a worker error or a worker returning — ends
+        # the session, so a single wait on the first completion is enough.
+        done, _ = await asyncio.wait(
+            tasks | {stop_task},
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if stop_task not in done and any(
+            not task.cancelled() and task.exception() is None for task in done
+        ):
+            # A worker task ending unexpectedly means connection/input
+            # loop has ended; stop session cleanly.
+            self._log_event("worker task finished; ending session")
+        self._stop_event.set()
 
         with contextlib.suppress(Exception):
             await session.send_realtime_input(audio_stream_end=True)